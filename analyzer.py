@@ -1,6 +1,6 @@
-from langdetect import detect
 from importlib import import_module
-from converters import extract_raw_text
+from converters import extract_raw_text, prewarm as prewarm_converters
+from threading import Thread, Event
 import filters
 from copy import copy
 
@@ -52,7 +52,18 @@ class Analyzer:
         return self._input_text
 
 
+# cleared while the heavy dependencies are loaded in the background: neither the langdetect
+# profiles nor the NLTK corpora are safe to load from two threads at once
+_prewarm_done = Event()
+_prewarm_done.set()
+
+
 def pipeline_builder(lang, default_lang):
+    _prewarm_done.wait()
+    return _build_pipeline(lang, default_lang)
+
+
+def _build_pipeline(lang, default_lang):
     pipeline = list()
 
     try:
@@ -74,6 +85,46 @@ def pipeline_builder(lang, default_lang):
     return tokenizer, pipeline, lang
 
 
+def detect(text):
+    _prewarm_done.wait()
+    return _detect(text)
+
+
+def _detect(text):
+    # langdetect is slow to import and loads its profiles on first call
+    from langdetect import detect as detect_lang
+    return detect_lang(text)
+
+
+def prewarm(langs=('fr', 'en')):
+    """Loads in a background thread the heavy dependencies of the analyzers
+    (pdfminer, langdetect profiles, NLTK corpora and stemmers of <langs>)
+    so that the first analysis does not pay for them.
+    Analyses started meanwhile wait for the warm up to complete. Returns the started thread"""
+    def warm_up_pipeline(lang):
+        tokenizer, pipeline, _ = _build_pipeline(lang, lang)
+        tokens = tokenizer('warm up')
+        for op in pipeline:
+            tokens = op(tokens)
+
+    def warm_up():
+        steps = [prewarm_converters, lambda: _detect('warm up')]
+        steps.extend(lambda lang=lang: warm_up_pipeline(lang) for lang in langs)
+        try:
+            for step in steps:
+                try:
+                    step()
+                except Exception as e:  # e.g. a missing NLTK corpus, raised again on first use
+                    print(f'pre-warming step failed: {e!r}')
+        finally:
+            _prewarm_done.set()
+
+    _prewarm_done.clear()
+    thread = Thread(target=warm_up, daemon=True)
+    thread.start()
+    return thread
+
+
 class SourceFilename:
     def __init__(self, filename):
         self._filename = filename
@@ -3,13 +3,17 @@ Run this command line interpret to explore this P.o.C.
 SYNOPSIS
 ADD <doc> or MADD <glob>
 SEARCH <terms>
+SIMILAR <doc_id> [k]
+Start with --prewarm to load the language pipelines in the background
 """
 
 from cmd import Cmd
 from docbase import DocumentBase
+from analyzer import prewarm
 
 import os.path
 import glob
+import sys
 
 
 class CmdUI(Cmd):
@@ -176,7 +180,27 @@ otherwise language detection is performed on <terms>."""
         for result in self.service.search(args):
             print(f'file {result[1]} with relevancy of {result[0]}')
 
+    def do_similar(self, args):
+        """Syntax: SIMILAR doc_id [k]
+Description: approximate search of the <k> documents most similar to the document <doc_id>.
+doc_id is the ID displayed when the document was added, k defaults to 5."""
+        usage = 'Syntax: SIMILAR doc_id [k] with k a positive integer'
+        if not args or len(args.split()) > 2:
+            print(usage)
+            return
+
+        doc_id, *k = args.split()
+        try:
+            for result in self.service.find_similar(doc_id, *map(int, k)):
+                print(f'file {result[1]} with similarity of {result[0]}')
+        except KeyError:
+            print(f'Document not found: {doc_id}')
+        except ValueError:
+            print(usage)
+
 
 if __name__ == '__main__':
+    if '--prewarm' in sys.argv[1:]:
+        prewarm()
     cmd = CmdUI(service=DocumentBase())
     cmd.cmdloop()
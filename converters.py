@@ -1,9 +1,12 @@
-import pdfminer.layout
-import pdfminer.high_level
+from importlib import import_module
 import io
 
 
 def extract_raw_text(pdf_filename):
+    # pdfminer is slow to import, it is only loaded when a first document is converted
+    import pdfminer.layout
+    import pdfminer.high_level
+
     output = io.StringIO()
     params = pdfminer.layout.LAParams()  # Using the defaults seems to work fine
 
@@ -11,3 +14,9 @@ def extract_raw_text(pdf_filename):
         pdfminer.high_level.extract_text_to_fp(file, output, laparams=params)
 
     return output.getvalue()
+
+
+def prewarm():
+    """Imports ahead of time the modules the conversion of a first document would load"""
+    import_module('pdfminer.layout')
+    import_module('pdfminer.high_level')
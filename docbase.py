@@ -3,6 +3,7 @@ from collections import namedtuple
 from math import log10
 from copy import copy
 from vector import cosine_similarity
+from lsh import RandomProjectionIndex
 
 from analyzer import Analyzer, SourceFilename, pipeline_builder, SourceRawText
 import statistics
@@ -124,18 +125,25 @@ class DocumentBase:
 
             self._vectors[entry.doc_id][j] = coordinate
 
+        # index the new vector for similar document search
+        # vectors already indexed only got null components on the new dimensions
+        self._similarity_index.add(entry.doc_id, self._vectors[entry.doc_id])
+
     @staticmethod
     def create_document_id(text):
         method = sha1()
         method.update(text.encode())
         return method.hexdigest()
 
-    def __init__(self):
+    def __init__(self, nb_tables=12, nb_bits=5):
+        """<nb_tables> and <nb_bits> tune the similar document index:
+        more tables for a better recall, more bits for faster queries"""
         self._document_base = {}
         self._inverted_index = {}
         self._features = {}
         self._vector_base_map = {}
         self._vectors = {}
+        self._similarity_index = RandomProjectionIndex(nb_tables, nb_bits)
         self._pdf_analyzer = Analyzer(pipeline_builder, SourceFilename, 'fr')
         self._query_analyzer = Analyzer(pipeline_builder, SourceRawText, 'fr')
 
@@ -178,7 +186,13 @@ class DocumentBase:
         transact, _, report = self._analyze_doc_helper(filename)
         self._commit(transact)
 
-        return transact.get_document_entry().doc_id, report
+        # near duplicate detection reuses the similar document index
+        doc_id = transact.get_document_entry().doc_id
+        nearest = next(self.find_similar(doc_id, 1), ('n/a', None))
+        report['nearest document'] = nearest[1]
+        report['nearest similarity'] = nearest[0]
+
+        return doc_id, report
 
     def _prepare_query(self, terms):
         analyzer = self._query_analyzer
@@ -213,6 +227,19 @@ class DocumentBase:
         results = sorted(results, key=lambda x: x[0], reverse=True)
         return iter(results)
 
+    def find_similar(self, doc_id, k=5):
+        """Approximate search of the <k> documents most similar to the document <doc_id>
+        yields (similarity, name) pairs like search does"""
+        if doc_id not in self._vectors:
+            raise KeyError(doc_id)
+        if k < 1:
+            raise ValueError(f'k must be a positive integer, got {k}')
+
+        results = self._similarity_index.query(doc_id, k)
+        results = map(lambda x: (x[0], self._document_base[x[1]].name), results)
+        results = filter(lambda x: x[0] > 0, results)
+        return iter(list(results))
+
     @property
     def full_report(self):
         """Returns:
@@ -0,0 +1,114 @@
+from random import Random
+from vector import vect_abs, non_zero_components
+
+
+class RandomProjectionIndex:
+    """Approximate nearest neighbour index over the tf-idf vectors of the doc base.
+    Each of the <nb_tables> hash tables draws <nb_bits> random hyperplanes; a vector is hashed
+    to the side of each hyperplane it lies on. Two vectors at an angle t share a bucket of a table
+    with a probability of (1 - t / pi) ** nb_bits.
+    More tables raise the recall, more bits per table shrink the buckets, hence the candidate
+    set, and speed up the queries. With the default 12 tables of 5 bits, a neighbour is found with
+    a probability of 0.999 at a cosine similarity of 0.9, 0.986 at 0.78 and 0.82 at 0.5, while
+    about a third of the unrelated vectors (cosine similarity near 0) are ranked as candidates.
+    When no candidate is found, the query falls back to an exact scan of the index."""
+
+    def __init__(self, nb_tables=12, nb_bits=5, seed=0):
+        assert nb_tables > 0
+        assert nb_bits > 0
+
+        self._random = Random(seed)
+        self._nb_tables = nb_tables
+        self._nb_bits = nb_bits
+        self._hyperplanes = [[[] for _ in range(nb_bits)] for _ in range(nb_tables)]
+        self._tables = [dict() for _ in range(nb_tables)]
+        self._signatures = dict()
+        self._components = dict()
+        self._norms = dict()
+        self._vectors = dict()
+
+    def _extend_hyperplanes(self, dimension):
+        """the vector space grows with every new term in the doc base, so do the hyperplanes.
+        Vectors already indexed have null components on the new dimensions,
+        their signatures are thus left unchanged"""
+        for table in self._hyperplanes:
+            for hyperplane in table:
+                while len(hyperplane) < dimension:
+                    hyperplane.append(self._random.gauss(0, 1))
+
+    def _signatures_of(self, dimension, components):
+        """tf-idf vectors are very sparse, only their non zero <components> are projected"""
+        self._extend_hyperplanes(dimension)
+        for table in self._hyperplanes:
+            bits = 0
+            for hyperplane in table:
+                bits <<= 1
+                if sum(hyperplane[j] * c for j, c in components) >= 0:
+                    bits |= 1
+            yield bits
+
+    def add(self, key, vector):
+        """the index keeps a reference to <vector>, which may only grow with null components"""
+        if key in self._signatures:
+            self.remove(key)
+
+        components = list(non_zero_components(vector))
+        signatures = tuple(self._signatures_of(len(vector), components))
+        for table, signature in zip(self._tables, signatures):
+            table.setdefault(signature, set()).add(key)
+
+        self._signatures[key] = signatures
+        self._components[key] = components
+        self._norms[key] = vect_abs(c for _, c in components)
+        self._vectors[key] = vector
+
+    def remove(self, key):
+        for table, signature in zip(self._tables, self._signatures.pop(key)):
+            table[signature].discard(key)
+            if not table[signature]:
+                del table[signature]
+
+        del self._components[key]
+        del self._norms[key]
+        del self._vectors[key]
+
+    def candidates(self, key):
+        """yields the keys of all other indexed vectors sharing at least one bucket with <key>"""
+        seen = {key}
+        for table, signature in zip(self._tables, self._signatures[key]):
+            for other in table[signature]:
+                if other not in seen:
+                    seen.add(other)
+                    yield other
+
+    def query(self, key, k):
+        """returns at most <k> (similarity, key) pairs sorted by decreasing cosine similarity
+        to the vector indexed as <key>.
+        Only candidates are ranked with the exact cosine similarity, not the whole index"""
+        assert k > 0
+
+        norm = self._norms[key]
+        if norm == 0:
+            return []
+
+        others = list(self.candidates(key))
+        if not others:
+            others = [other for other in self._signatures if other != key]
+
+        components = self._components[key]
+        results = []
+        for other in others:
+            if self._norms[other] == 0:
+                continue
+
+            vector = self._vectors[other]
+            similarity = sum(c * vector[j] for j, c in components) / (norm * self._norms[other])
+            results.append((similarity, other))
+
+        return sorted(results, key=lambda x: x[0], reverse=True)[:k]
+
+    def __contains__(self, key):
+        return key in self._signatures
+
+    def __len__(self):
+        return len(self._signatures)